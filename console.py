@@ -4,6 +4,7 @@ from lib.rag_importer import DataImporter
 from lib.sample_data import DataLoader
 from lib.rag_query import LLMSearch
 from lib.config_parser import RAGConfig
+from lib.semantic_cache import SemanticCache
 
 from rich.console import Console
 from rich.panel import Panel
@@ -13,9 +14,17 @@ import json
 def main():
     console = Console()
     config = RAGConfig().get()
-    embed_fn = Embedder(config.embedder_provider, config.embedder_model).initialize
+    embedder = Embedder(
+        config.embedder_provider, config.embedder_model, config.embedding_cache
+    )
+    embed_fn = embedder.initialize
     collection = PersistentClient(path=config.db_location).get_or_create_collection(
-        "documents"
+        "documents", metadata=config.hnsw_metadata
+    )
+    semantic_cache = (
+        SemanticCache(config.semantic_cache_location, config.semantic_cache_threshold)
+        if config.semantic_cache
+        else None
     )
 
     if config.do_import:
@@ -37,18 +46,41 @@ def main():
             embed_fn=embed_fn,
             overlap=config.overlap,
             chunk_size=config.chunk_size,
+            batch_size=config.batch_size,
+            # API requests are I/O bound; local models already use all cores
+            workers=8 if config.embedder_provider == "openai" else 1,
+            batch_embed_fn=(
+                embedder.initialize_batch
+                if config.embedder_provider == "openai" and config.openai_batch
+                else None
+            ),
             verbose=True,
+            very_verbose=config.very_verbose,
         )
         importer.load_data(
             documents,
         )
 
+        # Cached answers of every search model may no longer match the updated collection
+        SemanticCache.remove_files(config.semantic_cache_prefix)
+        if semantic_cache:
+            semantic_cache.clear()
+
     if config.query:
+        n_results = 3
+        query_embeddings = embed_fn([config.query])
 
-        # Search in chromadb
-        results = collection.query(
-            query_embeddings=embed_fn([config.query]), n_results=3
+        cached = (
+            semantic_cache.lookup(query_embeddings[0], {"n_results": n_results})
+            if semantic_cache
+            else None
         )
+        if cached:
+            console.print(Panel(cached["answer"], title="Results (cached)"))
+            return
+
+        # Search in chromadb
+        results = collection.query(query_embeddings=query_embeddings, n_results=n_results)
 
         if (
             results.get("documents")
@@ -61,6 +93,13 @@ def main():
             response = rag.search_with_context(config.query, results)
             console.print(Panel(response, title="Results"))
 
+            # Errors are returned as "[...]" messages and should not be cached
+            if semantic_cache and not response.startswith("["):
+                semantic_cache.add(
+                    query_embeddings[0],
+                    {"query": config.query, "answer": response, "n_results": n_results},
+                )
+
 
 if __name__ == "__main__":
     main()
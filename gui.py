@@ -1,59 +1,175 @@
-from typing import List, Literal, Optional, Tuple
+import asyncio
+import functools
+from collections import deque
+from typing import AsyncIterator, Deque, List, Literal, Optional, Tuple
 
 import gradio as gr
 from chromadb import PersistentClient
 
-from lib.embeding import embeder_loader
-from lib.parser import parse_args
-from lib.search import search
+from lib.config_parser import RAGConfig
+from lib.embedding import Embedder
+from lib.query_batcher import QueryBatcher
+from lib.rag_query import LLMSearch
+from lib.semantic_cache import SemanticCache
 
+semantic_caches = {}
 
-def chat_fn(
+
+@functools.lru_cache()
+def get_collection(db_location: str):
+    """
+    Returns the ChromaDB collection, sharing a single PersistentClient across chat calls.
+
+    Args:
+        db_location (str): Path of the ChromaDB database.
+
+    Returns:
+        Collection: The "documents" collection.
+    """
+    return PersistentClient(path=db_location).get_or_create_collection(
+        "documents", metadata=args.hnsw_metadata
+    )
+
+
+@functools.lru_cache()
+def get_query_batcher(db_location: str) -> QueryBatcher:
+    """
+    Returns the shared QueryBatcher, so concurrent chat queries are sent to ChromaDB together.
+
+    Args:
+        db_location (str): Path of the ChromaDB database.
+
+    Returns:
+        QueryBatcher: The batcher for the "documents" collection.
+    """
+    return QueryBatcher(get_collection(db_location))
+
+
+@functools.lru_cache()
+def get_llm_search(search_provider: str, search_model: str, verbose: bool) -> LLMSearch:
+    """
+    Returns a shared LLMSearch instance for the given provider and model.
+
+    Args:
+        search_provider (str): The search backend.
+        search_model (str): The LLM model answering the queries.
+        verbose (bool): Whether to enable verbose logging.
+
+    Returns:
+        LLMSearch: The search instance.
+    """
+    return LLMSearch(provider=search_provider, model=search_model, verbose=verbose)
+
+
+def get_semantic_cache(search_provider: str, search_model: str) -> Optional[SemanticCache]:
+    """
+    Returns the semantic cache for the given search model, creating it on first use.
+
+    Args:
+        search_provider (str): The search backend.
+        search_model (str): The LLM model answering the queries.
+
+    Returns:
+        Optional[SemanticCache]: The cache, or None if the semantic cache is disabled.
+    """
+    if not args.semantic_cache:
+        return None
+    if search_model not in semantic_caches:
+        semantic_caches[search_model] = SemanticCache(
+            f"{args.semantic_cache_prefix}{search_provider}-{search_model.replace(':', '-')}",
+            args.semantic_cache_threshold,
+        )
+    return semantic_caches[search_model]
+
+
+async def chat_fn(
     message: str,
     history: Optional[List[Tuple[str, str]]],
+    history_formatted: Optional[Deque[str]],
     search_provider: Literal["openai", "local"],
     n_results: int,
-) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+) -> AsyncIterator[Tuple[List[Tuple[str, str]], List[Tuple[str, str]], Deque[str]]]:
     """
-    Handles a single chat interaction.
+    Handles a single chat interaction, streaming the answer into the chat as it is generated.
+
+    Embedding runs in a worker thread, the ChromaDB query is batched with those of other users
+    and the LLM call is awaited, so one slow request does not block other users.
 
     Args:
         message (str): The user's message.
         history (Optional[List[Tuple[str, str]]]): Conversation history as list of (user, assistant) message pairs.
+        history_formatted (Optional[Deque[str]]): The last two exchanges, already formatted for the prompt.
         search_provider (Literal["openai", "local"]): The search backend to use.
         n_results (int): Number of top documents to retrieve from ChromaDB.
 
-    Returns:
-        Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    Yields:
+        Tuple[List[Tuple[str, str]], List[Tuple[str, str]], Deque[str]]:
             - First element: messages to display in the chat UI (usually full or truncated history).
             - Second element: updated history to store in state.
+            - Third element: updated formatted history to store in state.
     """
     history = history or []
-
-    results = collection.query(
-        query_embeddings=embed_fn([message]), n_results=int(n_results)
-    )
+    if history_formatted is None:
+        history_formatted = deque(maxlen=2)
 
     if search_provider == "openai":
         search_model = "gpt-4o-mini"
     else:
         search_model = "llama3.1:8b"
 
-    if history:
-        previous_messages = "\n".join(
-            [
-                f"    User: {q.strip()}\n    Assistant: {a.strip()}"
-                for q, a in history[-2:]
-            ]
+    query_embeddings = await asyncio.to_thread(embed_fn, [message])
+
+    # Answers depend on previous turns, so only the first message uses the cache
+    n_results = int(n_results)
+    semantic_cache = None if history else get_semantic_cache(search_provider, search_model)
+    cached = (
+        semantic_cache.lookup(query_embeddings[0], {"n_results": n_results})
+        if semantic_cache
+        else None
+    )
+    if cached:
+        history.append((message, cached["answer"]))
+        history_formatted.append(
+            f"    User: {message.strip()}\n    Assistant: {cached['answer'].strip()}"
         )
+        yield history, history, history_formatted
+        return
+
+    results = await get_query_batcher(args.db_location).query(
+        query_embeddings[0], n_results
+    )
+
+    if history_formatted:
+        previous_messages = "\n".join(history_formatted)
         full_message = f"{message}\n\n    History:\n{previous_messages}"
     else:
         full_message = f"User: {message}"
 
-    answer = search(full_message, results, search_provider, search_model, args.verbose)
+    rag = get_llm_search(search_provider, search_model, args.verbose)
+    answer = ""
+    failed = False
     history.append((message, answer))
+    try:
+        async for fragment in rag.astream_with_context(full_message, results):
+            answer += fragment
+            history[-1] = (message, answer)
+            yield history, history, history_formatted
+    except Exception as e:
+        # Shown after whatever part of the answer arrived, but never cached
+        failed = True
+        history[-1] = (message, f"{answer}\n\n[LLM query error]: {e}".lstrip())
+
+    history_formatted.append(
+        f"    User: {message.strip()}\n    Assistant: {answer.strip()}"
+    )
+    yield history, history, history_formatted
 
-    return history, history
+    # "[...]" answers report that no documents were found and should not be cached
+    if semantic_cache and answer and not failed and not answer.startswith("["):
+        semantic_cache.add(
+            query_embeddings[0],
+            {"query": message, "answer": answer, "n_results": n_results},
+        )
 
 
 with gr.Blocks() as my_rag:
@@ -62,6 +178,7 @@ with gr.Blocks() as my_rag:
     msg = gr.Textbox(label="Enter message", placeholder="Ask question...")
     send_btn = gr.Button("Send")
     state = gr.State([])
+    formatted_state = gr.State(deque(maxlen=2))
 
     with gr.Row():
         search_provider = gr.Dropdown(
@@ -77,14 +194,14 @@ with gr.Blocks() as my_rag:
 
     send_btn.click(
         fn=chat_fn,
-        inputs=[msg, state, search_provider, n_results],
-        outputs=[chatbot, state],
+        inputs=[msg, state, formatted_state, search_provider, n_results],
+        outputs=[chatbot, state, formatted_state],
+        concurrency_limit=10,
     )
 
 if __name__ == "__main__":
-    args = parse_args()
-    collection = PersistentClient(path=args.db_location).get_or_create_collection(
-        "documents"
-    )
-    embed_fn = embeder_loader(args)
+    args = RAGConfig().get()
+    embed_fn = Embedder(
+        args.embedder_provider, args.embedder_model, args.embedding_cache
+    ).initialize
     my_rag.launch()
@@ -1,4 +1,5 @@
 import argparse
+import functools
 from rich.console import Console
 from rich.panel import Panel
 
@@ -13,17 +14,33 @@ class RAGConfig:
 
     def __init__(self):
         """
-        Initializes the RAGConfig class, sets up the console for rich text output,
-        and parses the command-line arguments.
+        Initializes the RAGConfig class and parses the command-line arguments.
+
+        The settings summary is printed only in verbose mode.
         """
-        self.console = Console()
         self.args = self._parse_args()
 
-    def _parse_args(self):
+        if self.args.verbose:
+            self._print_summary(self.args)
+
+    @functools.cached_property
+    def console(self) -> Console:
+        """
+        Console for rich text output, created on first use.
+
+        Returns:
+            Console: The rich console.
+        """
+        return Console()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _parse_args():
         """
         Parses command-line arguments and returns them as a Namespace object.
 
-        Sets default values for arguments if they are not provided.
+        Sets default values for arguments if they are not provided. The result is cached,
+        so creating RAGConfig more than once in a process parses the arguments only once.
 
         Returns:
             argparse.Namespace: The parsed arguments with default values applied.
@@ -62,6 +79,47 @@ class RAGConfig:
             help="Number of overlapping characters between chunks",
         )
 
+        parser.add_argument(
+            "--batch_size",
+            type=int,
+            default=64,
+            help="Number of chunks embedded and stored per batch during import",
+        )
+
+        parser.add_argument(
+            "--openai_batch",
+            action="store_true",
+            help="Use the OpenAI Batch API for imports of more than 100 chunks (cheaper, may take up to 24h)",
+        )
+
+        parser.add_argument(
+            "--hnsw_ef_search",
+            type=int,
+            default=64,
+            help="HNSW candidate list size at query time (higher: better recall, slower queries)",
+        )
+
+        parser.add_argument(
+            "--hnsw_construction_ef",
+            type=int,
+            default=100,
+            help="HNSW candidate list size when building the index (used when the collection is created)",
+        )
+
+        parser.add_argument(
+            "--hnsw_M",
+            type=int,
+            default=16,
+            help="HNSW number of links per node (used when the collection is created)",
+        )
+
+        parser.add_argument(
+            "--no_embedding_cache",
+            dest="embedding_cache",
+            action="store_false",
+            help="Disable the on-disk cache of computed embeddings",
+        )
+
         parser.add_argument(
             "--search_provider",
             choices=["openai", "local"],
@@ -78,6 +136,20 @@ class RAGConfig:
             help="LLM model name",
         )
 
+        parser.add_argument(
+            "--semantic_cache_threshold",
+            type=float,
+            default=0.97,
+            help="Minimum cosine similarity for a query to reuse a cached answer",
+        )
+
+        parser.add_argument(
+            "--no_semantic_cache",
+            dest="semantic_cache",
+            action="store_false",
+            help="Disable reusing answers of semantically similar queries",
+        )
+
         parser.add_argument(
             "--import",
             dest="do_import",
@@ -98,6 +170,12 @@ class RAGConfig:
             help="Enable debug mode",
         )
 
+        parser.add_argument(
+            "--very_verbose",
+            action="store_true",
+            help="Also print every imported chunk",
+        )
+
         args = parser.parse_args()
 
         # --- Default values ---
@@ -114,9 +192,14 @@ class RAGConfig:
             )
 
         args.db_location = f"./chroma_db_{args.embedder_provider}-model-{args.embedder_model.replace('/', '-')}"
-
-        if args.verbose:
-            self._print_summary(args)
+        # One semantic cache per search model, all sharing the prefix so an import can clear them together
+        args.semantic_cache_prefix = f"{args.db_location}-semantic-cache-"
+        args.semantic_cache_location = f"{args.semantic_cache_prefix}{args.search_provider}-{args.search_model.replace(':', '-')}"
+        args.hnsw_metadata = {
+            "hnsw:search_ef": args.hnsw_ef_search,
+            "hnsw:construction_ef": args.hnsw_construction_ef,
+            "hnsw:M": args.hnsw_M,
+        }
 
         return args
 
@@ -133,10 +216,18 @@ class RAGConfig:
             f"Model: [green]{args.embedder_model}[/green]\n"
             f"Database Location: [green]{args.db_location}[/green]\n"
             f"Chunk size: [green]{args.chunk_size}[/green]\n"
-            f"Overlap: [green]{args.overlap}[/green]\n\n"
+            f"Overlap: [green]{args.overlap}[/green]\n"
+            f"Batch size: [green]{args.batch_size}[/green]\n"
+            f"Embedding cache: [green]{'yes' if args.embedding_cache else 'no'}[/green]\n"
+            f"OpenAI Batch API: [green]{'yes' if args.openai_batch else 'no'}[/green]\n\n"
+            "[bold cyan]HNSW Index:[/bold cyan]\n"
+            f"ef_search: [green]{args.hnsw_ef_search}[/green] (lower: faster queries, lower recall)\n"
+            f"construction_ef: [green]{args.hnsw_construction_ef}[/green]\n"
+            f"M: [green]{args.hnsw_M}[/green] (higher: better recall, more memory)\n\n"
             "[bold cyan]LLM Search:[/bold cyan]\n"
             f"Provider: [green]{args.search_provider}[/green]\n"
-            f"Model: [green]{args.search_model}[/green]\n\n"
+            f"Model: [green]{args.search_model}[/green]\n"
+            f"Semantic cache: [green]{args.semantic_cache_threshold if args.semantic_cache else 'no'}[/green]\n\n"
             "[bold cyan]Flags:[/bold cyan]\n"
             f"Import Data: [green]{'yes' if args.do_import else 'no'}[/green]\n"
             f"Query Search: [green]{'yes' if args.query else 'no'}[/green]"
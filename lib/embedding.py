@@ -1,9 +1,17 @@
+import io
+import json
 import os
+import threading
+import time
 from typing import List, Dict
+import numpy as np
+import torch
 from dotenv import load_dotenv
 from openai import OpenAI
 from sentence_transformers import SentenceTransformer
 
+from lib.embedding_cache import EmbeddingCache
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -12,19 +20,27 @@ class Embedder:
     """
     Class responsible for generating embeddings — either locally (using SentenceTransformer) or through the OpenAI API.
 
-    It also manages local model caching.
+    It also manages local model caching and, optionally, a persistent cache of computed embeddings.
     """
 
     # Cache to store locally loaded models
     _local_models: Dict[str, SentenceTransformer] = {}
-
-    def __init__(self, provider: str = "local", model_name: str = "all-mpnet-base-v2"):
+    # Guards loading, so concurrent first requests load a model only once
+    _local_models_lock = threading.Lock()
+
+    def __init__(
+        self,
+        provider: str = "local",
+        model_name: str = "all-mpnet-base-v2",
+        use_cache: bool = True,
+    ):
         """
         Initializes the Embedder class.
 
         Args:
             provider (str): The provider to use for generating embeddings. Can be either 'openai' for OpenAI API or 'local' for local models.
             model_name (str): The model name to use for embedding generation. Defaults to 'all-mpnet-base-v2'.
+            use_cache (bool): Whether to reuse previously computed embeddings from the on-disk cache.
 
         Raises:
             ValueError: If the provider is not supported or if the OpenAI API key is missing.
@@ -32,6 +48,7 @@ class Embedder:
         self.provider = provider
         self.model_name = model_name
         self.openai_client = None
+        self.cache = EmbeddingCache() if use_cache else None
 
         # Initialize OpenAI client if using OpenAI API
         if provider == "openai":
@@ -42,46 +59,180 @@ class Embedder:
                 )
             self.openai_client = OpenAI(api_key=api_key)
 
-        # Initialize SentenceTransformer client if using local models
+        # Local models are loaded lazily, on the first embedding request
         elif provider == "local":
-            if model_name not in self._local_models:
-                self._local_models[model_name] = SentenceTransformer(model_name)
+            pass
         else:
             raise ValueError(f"Unsupported provider: {provider}")
 
-    def initialize(self, texts: List[str]) -> List[List[float]]:
+    def initialize(self, texts: List[str]) -> np.ndarray:
         """
         Generates embeddings for a list of input texts.
 
         Depending on the selected provider, this method will either call the OpenAI API or use a local model.
+        Texts already present in the embedding cache are not sent to the provider.
 
         Args:
             texts (List[str]): A list of strings for which embeddings should be generated.
 
         Returns:
-            List[List[float]]: A list of embeddings, where each embedding is a list of floats.
+            np.ndarray: A float32 array of shape (len(texts), dimensions), one embedding per row.
         """
         if self.provider == "openai":
-            return self._get_openai_embeddings(texts)
+            compute_fn = self._get_openai_embeddings
         else:
-            return self._get_local_embeddings(texts)
+            compute_fn = self._get_local_embeddings
+
+        if self.cache is None:
+            return compute_fn(texts)
+        return self.cache.get_or_compute(texts, self.model_name, compute_fn)
+
+    def initialize_batch(self, texts: List[str], min_batch_size: int = 100) -> np.ndarray:
+        """
+        Generates embeddings for a large list of texts using the OpenAI Batch API.
+
+        Batch jobs are cheaper than regular requests but may take up to 24 hours, so this is meant
+        for bulk imports. Texts already present in the embedding cache are not sent, and if fewer than
+        min_batch_size texts remain, they are embedded with a regular request instead of a batch job.
+
+        Args:
+            texts (List[str]): A list of strings for which embeddings should be generated.
+            min_batch_size (int): Minimum number of uncached texts for a batch job to be started.
+
+        Returns:
+            np.ndarray: A float32 array of shape (len(texts), dimensions), one embedding per row.
+
+        Raises:
+            ValueError: If the provider is not OpenAI.
+        """
+        if self.provider != "openai":
+            raise ValueError("The Batch API is only available for the openai provider")
+
+        def compute_fn(uncached: List[str]) -> np.ndarray:
+            if len(uncached) < min_batch_size:
+                return self._get_openai_embeddings(uncached)
+            return self._get_openai_batch_embeddings(uncached)
+
+        if self.cache is None:
+            return compute_fn(texts)
+        return self.cache.get_or_compute(texts, self.model_name, compute_fn)
+
+    def _get_openai_batch_embeddings(
+        self, texts: List[str], poll_interval: float = 30
+    ) -> np.ndarray:
+        """
+        Runs an OpenAI batch job embedding the texts and waits for its results.
+
+        Args:
+            texts (List[str]): A list of strings for which embeddings should be generated.
+            poll_interval (float): Seconds between batch status checks.
 
-    def _get_openai_embeddings(self, texts: List[str]) -> List[List[float]]:
+        Returns:
+            np.ndarray: The embeddings in the same order as the input texts, one per row.
+
+        Raises:
+            RuntimeError: If the batch job does not complete or a request in it fails.
+        """
+        requests_jsonl = "\n".join(
+            json.dumps(
+                {
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/embeddings",
+                    "body": {"model": self.model_name, "input": text},
+                }
+            )
+            for i, text in enumerate(texts)
+        )
+        input_file = self.openai_client.files.create(
+            file=("embeddings.jsonl", io.BytesIO(requests_jsonl.encode())),
+            purpose="batch",
+        )
+        batch = self.openai_client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/embeddings",
+            completion_window="24h",
+        )
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = self.openai_client.batches.retrieve(batch.id)
+
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"OpenAI batch {batch.id} finished with status {batch.status}")
+
+        embeddings: List = [None] * len(texts)
+        output = self.openai_client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line:
+                continue
+            result = json.loads(line)
+            if result.get("error") or result["response"]["status_code"] != 200:
+                raise RuntimeError(
+                    f"OpenAI batch request {result['custom_id']} failed: {result.get('error')}"
+                )
+            embeddings[int(result["custom_id"])] = result["response"]["body"]["data"][0][
+                "embedding"
+            ]
+
+        if any(embedding is None for embedding in embeddings):
+            raise RuntimeError(f"OpenAI batch {batch.id} returned incomplete results")
+        return np.asarray(embeddings, dtype=np.float32)
+
+    def _get_openai_embeddings(self, texts: List[str]) -> np.ndarray:
         """
-        Fetches embeddings from OpenAI's API.
+        Fetches embeddings from OpenAI's API. Transient errors are retried by the OpenAI client.
 
         Args:
             texts (List[str]): A list of strings for which embeddings should be generated.
 
         Returns:
-            List[List[float]]: A list of embeddings returned by OpenAI API.
+            np.ndarray: The embeddings returned by OpenAI API, one per row.
         """
         response = self.openai_client.embeddings.create(
             input=texts, model=self.model_name
         )
-        return [r.embedding for r in response.data]
+        return np.asarray([r.embedding for r in response.data], dtype=np.float32)
 
-    def _get_local_embeddings(self, texts: List[str]) -> List[List[float]]:
+    @staticmethod
+    def _select_device() -> str:
+        """
+        Picks the fastest available device for local models.
+
+        Returns:
+            str: "cuda", "mps" or "cpu".
+        """
+        if torch.cuda.is_available():
+            return "cuda"
+        if torch.backends.mps.is_available():
+            return "mps"
+        return "cpu"
+
+    def _get_local_model(self) -> SentenceTransformer:
+        """
+        Returns the local SentenceTransformer model, loading it on first use.
+
+        The model is placed on the GPU when one is available and cast to fp16 on CUDA.
+        Loaded models are shared between all Embedder instances.
+
+        Returns:
+            SentenceTransformer: The loaded model.
+        """
+        model = self._local_models.get(self.model_name)
+        if model is not None:
+            return model
+
+        with self._local_models_lock:
+            # Another thread may have loaded the model while this one waited for the lock
+            if self.model_name not in self._local_models:
+                device = self._select_device()
+                model = SentenceTransformer(self.model_name, device=device)
+                if device == "cuda":
+                    model.half()
+                self._local_models[self.model_name] = model
+            return self._local_models[self.model_name]
+
+    def _get_local_embeddings(self, texts: List[str]) -> np.ndarray:
         """
         Generates embeddings using a locally loaded model.
 
@@ -89,7 +240,12 @@ class Embedder:
             texts (List[str]): A list of strings for which embeddings should be generated.
 
         Returns:
-            List[List[float]]: A list of embeddings generated using the local SentenceTransformer model.
+            np.ndarray: The embeddings generated using the local SentenceTransformer model, one per row.
         """
-        model = self._local_models[self.model_name]
-        return model.encode(texts, show_progress_bar=False).tolist()
+        model = self._get_local_model()
+        return model.encode(
+            texts,
+            batch_size=128 if model.device.type == "cuda" else 64,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        ).astype(np.float32, copy=False)
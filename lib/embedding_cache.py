@@ -0,0 +1,175 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    Persistent cache of text embeddings, keyed by SHA-256 of the model name and the text.
+
+    Lookups go through a small in-memory LRU first and fall back to a SQLite file, where vectors
+    are stored as float16 blobs by default, halving the file size with negligible loss of precision.
+    Entries older than the configured TTL are treated as missing and deleted when the cache is opened.
+    """
+
+    def __init__(
+        self,
+        path: str = "./.emb_cache.sqlite",
+        ttl: Optional[float] = 30 * 24 * 3600,
+        memory_size: int = 1024,
+        dtype: str = "float16",
+    ):
+        """
+        Initializes the EmbeddingCache and creates the backing table if needed.
+
+        Args:
+            path (str): Location of the SQLite file.
+            ttl (Optional[float]): Time to live of an entry in seconds. None disables expiry.
+            memory_size (int): Maximum number of embeddings kept in the in-memory LRU.
+            dtype (str): NumPy dtype used to store vectors on disk, e.g. "float16" or "float32".
+        """
+        self.ttl = ttl
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._dtype = np.dtype(dtype)
+        # One table per storage dtype, so blobs are never decoded with the wrong type
+        self._table = f"embeddings_{self._dtype.name}"
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            f"CREATE TABLE IF NOT EXISTS {self._table} "
+            "(key TEXT PRIMARY KEY, vector BLOB NOT NULL, created_at REAL NOT NULL)"
+        )
+        if ttl is not None:
+            self._db.execute(
+                f"DELETE FROM {self._table} WHERE created_at < ?", (time.time() - ttl,)
+            )
+        self._db.commit()
+
+    @staticmethod
+    def _key(model_name: str, text: str) -> str:
+        """
+        Builds the cache key for a text embedded with the given model.
+
+        Args:
+            model_name (str): The embedding model name.
+            text (str): The embedded text.
+
+        Returns:
+            str: Hex digest identifying the (model, text) pair.
+        """
+        return hashlib.sha256(f"{model_name}|{text}".encode()).hexdigest()
+
+    def _remember(self, key: str, vector: np.ndarray):
+        """
+        Stores a vector in the in-memory LRU, evicting the oldest entry when full.
+
+        Args:
+            key (str): The cache key.
+            vector (np.ndarray): The embedding.
+        """
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _lookup(self, keys: List[str]) -> dict:
+        """
+        Finds cached embeddings for the given keys.
+
+        Args:
+            keys (List[str]): The cache keys to look up.
+
+        Returns:
+            dict: Mapping of found keys to their embeddings.
+        """
+        found = {}
+        missing = []
+        for key in keys:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                found[key] = self._memory[key]
+            else:
+                missing.append(key)
+
+        if missing:
+            min_created = time.time() - self.ttl if self.ttl is not None else 0
+            # SQLite limits the number of bound parameters per statement
+            for start in range(0, len(missing), 500):
+                part = missing[start : start + 500]
+                rows = self._db.execute(
+                    f"SELECT key, vector FROM {self._table} "
+                    f"WHERE key IN ({','.join('?' * len(part))}) AND created_at >= ?",
+                    (*part, min_created),
+                ).fetchall()
+                for key, blob in rows:
+                    vector = np.frombuffer(blob, dtype=self._dtype).astype(np.float32)
+                    found[key] = vector
+                    self._remember(key, vector)
+        return found
+
+    def _store(self, entries: dict) -> dict:
+        """
+        Saves new embeddings in memory and on disk.
+
+        Args:
+            entries (dict): Mapping of cache keys to embeddings.
+
+        Returns:
+            dict: Mapping of the cache keys to the embeddings as stored, rounded to the storage dtype.
+        """
+        now = time.time()
+        stored = {
+            key: np.asarray(vector, dtype=self._dtype) for key, vector in entries.items()
+        }
+        self._db.executemany(
+            f"INSERT OR REPLACE INTO {self._table} (key, vector, created_at) VALUES (?, ?, ?)",
+            [(key, vector.tobytes(), now) for key, vector in stored.items()],
+        )
+        self._db.commit()
+        # Keep the rounded vectors, so every lookup returns the same embedding for a text
+        rounded = {key: vector.astype(np.float32) for key, vector in stored.items()}
+        for key, vector in rounded.items():
+            self._remember(key, vector)
+        return rounded
+
+    def get_or_compute(
+        self,
+        texts: List[str],
+        model_name: str,
+        compute_fn: Callable[[List[str]], np.ndarray],
+    ) -> np.ndarray:
+        """
+        Returns embeddings for the texts, computing only the ones that are not cached.
+
+        Args:
+            texts (List[str]): The texts to embed.
+            model_name (str): The model name, part of the cache key.
+            compute_fn (Callable[[List[str]], np.ndarray]): Function embedding the uncached texts.
+
+        Returns:
+            np.ndarray: Float32 embeddings in the same order as the input texts, one per row.
+        """
+        keys = [self._key(model_name, text) for text in texts]
+        with self._lock:
+            found = self._lookup(keys)
+
+        # Deduplicate so repeated texts are embedded once
+        uncached = {}
+        for key, text in zip(keys, texts):
+            if key not in found:
+                uncached.setdefault(key, text)
+
+        if uncached:
+            computed = np.asarray(compute_fn(list(uncached.values())), dtype=np.float32)
+            with self._lock:
+                found.update(self._store(dict(zip(uncached.keys(), computed))))
+
+        if not keys:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack([found[key] for key in keys]).astype(np.float32, copy=False)
@@ -0,0 +1,146 @@
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+# max-age directive of a Cache-Control header
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+class PageCache:
+    """
+    On-disk cache of text extracted from fetched web pages, keyed by URL.
+
+    Entries are stored in SQLite together with the ETag and Last-Modified headers of the response.
+    An entry is fresh until the response's Cache-Control max-age (or the default expiry) runs out;
+    fresh entries are returned without any network request or HTML parsing. Stale entries are
+    revalidated with a conditional GET and reused when the server answers 304 Not Modified;
+    entries stale for longer than keep_stale are deleted when the cache is opened.
+    """
+
+    def __init__(
+        self,
+        path: str = "./.page_cache.sqlite",
+        expire_after: float = 3600,
+        keep_stale: float = 30 * 24 * 3600,
+    ):
+        """
+        Initializes the PageCache and creates the backing table if needed.
+
+        Args:
+            path (str): Location of the SQLite file.
+            expire_after (float): Default freshness lifetime in seconds, used when the response has no max-age.
+            keep_stale (float): Time in seconds an expired entry is kept for revalidation before it is deleted.
+        """
+        self.expire_after = expire_after
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS pages "
+            "(url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, text TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "DELETE FROM pages WHERE expires_at < ?", (time.time() - keep_stale,)
+        )
+        self._db.commit()
+
+    def _lifetime(self, headers: Dict[str, str]) -> Optional[float]:
+        """
+        Computes how long a response stays fresh from its Cache-Control header.
+
+        Args:
+            headers (Dict[str, str]): The response headers.
+
+        Returns:
+            Optional[float]: The freshness lifetime in seconds, or None if the response must not be stored.
+        """
+        cache_control = headers.get("Cache-Control", "").lower()
+        if "no-store" in cache_control:
+            return None
+
+        max_age = _MAX_AGE_RE.search(cache_control)
+        if "no-cache" in cache_control:
+            return 0
+        if max_age:
+            return int(max_age.group(1))
+        return self.expire_after
+
+    def get(self, url: str) -> Optional[Dict]:
+        """
+        Returns the cached entry for a URL, fresh or not.
+
+        Args:
+            url (str): The page URL.
+
+        Returns:
+            Optional[Dict]: The entry with "etag", "last_modified", "text" and "fresh" keys, or None if not cached.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT etag, last_modified, text, expires_at FROM pages WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, text, expires_at = row
+        return {
+            "etag": etag,
+            "last_modified": last_modified,
+            "text": text,
+            "fresh": expires_at > time.time(),
+        }
+
+    def set(self, url: str, text: str, headers: Dict[str, str]):
+        """
+        Stores the extracted text of a page, unless the response forbids caching.
+
+        Args:
+            url (str): The page URL.
+            text (str): The text extracted from the page.
+            headers (Dict[str, str]): The response headers.
+        """
+        lifetime = self._lifetime(headers)
+        if lifetime is None:
+            return
+
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO pages (url, etag, last_modified, text, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    url,
+                    headers.get("ETag"),
+                    headers.get("Last-Modified"),
+                    text,
+                    time.time() + lifetime,
+                ),
+            )
+            self._db.commit()
+
+    def refresh(self, url: str, headers: Dict[str, str]):
+        """
+        Marks a cached entry as fresh again after the server answered 304 Not Modified.
+
+        The ETag and Last-Modified values are updated only if the 304 response carries them.
+
+        Args:
+            url (str): The page URL.
+            headers (Dict[str, str]): The headers of the 304 response.
+        """
+        lifetime = self._lifetime(headers)
+        if lifetime is None:
+            return
+
+        with self._lock:
+            self._db.execute(
+                "UPDATE pages SET etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified), "
+                "expires_at = ? WHERE url = ?",
+                (
+                    headers.get("ETag"),
+                    headers.get("Last-Modified"),
+                    time.time() + lifetime,
+                    url,
+                ),
+            )
+            self._db.commit()
@@ -0,0 +1,110 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from chromadb.api.models.Collection import Collection
+
+# Keys of a Chroma query result holding one entry per query embedding
+_PER_QUERY_KEYS = (
+    "ids",
+    "embeddings",
+    "documents",
+    "uris",
+    "data",
+    "metadatas",
+    "distances",
+)
+
+
+class QueryBatcher:
+    """
+    Coalesces concurrent ChromaDB queries into batched collection.query calls.
+
+    Queries arriving within a short window are collected from an asyncio queue by a background task
+    and sent to Chroma as one multi-embedding query; each caller receives its own slice of the result.
+    """
+
+    def __init__(
+        self, collection: Collection, max_batch_size: int = 16, max_wait: float = 0.005
+    ):
+        """
+        Initializes the QueryBatcher.
+
+        Args:
+            collection (Collection): The Chroma collection to query.
+            max_batch_size (int): Maximum number of queries sent in one call.
+            max_wait (float): Time in seconds to wait for more queries after the first one arrives.
+        """
+        self.collection = collection
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def query(self, embedding: np.ndarray, n_results: int) -> Dict[str, Any]:
+        """
+        Queries the collection with a single embedding, batched with other pending queries.
+
+        Args:
+            embedding (np.ndarray): The query embedding.
+            n_results (int): Number of documents to return.
+
+        Returns:
+            Dict[str, Any]: A Chroma query result for this embedding only.
+        """
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((embedding, n_results, future))
+        return await future
+
+    async def _run(self):
+        """
+        Background task collecting queued queries into batches.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._dispatch(batch)
+
+    async def _dispatch(self, batch: List[Tuple[np.ndarray, int, asyncio.Future]]):
+        """
+        Sends one batched query to Chroma and resolves the callers' futures.
+
+        Args:
+            batch (List[Tuple[np.ndarray, int, asyncio.Future]]): Queued (embedding, n_results, future) entries.
+        """
+        embeddings = np.stack(
+            [np.asarray(embedding, dtype=np.float32).ravel() for embedding, _, _ in batch]
+        )
+        n_results = max(n for _, n, _ in batch)
+
+        try:
+            results = await asyncio.to_thread(
+                self.collection.query, query_embeddings=embeddings, n_results=n_results
+            )
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for index, (_, n, future) in enumerate(batch):
+            if future.done():
+                continue
+            single = dict(results)
+            for key in _PER_QUERY_KEYS:
+                if results.get(key) is not None:
+                    single[key] = [results[key][index][:n]]
+            future.set_result(single)
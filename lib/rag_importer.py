@@ -1,5 +1,7 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, List
+import numpy as np
 from chromadb import PersistentClient
 from rich.console import Console
 from rich.table import Table
@@ -17,26 +19,40 @@ class DataImporter:
     def __init__(
         self,
         chroma_collection: PersistentClient,
-        embed_fn: Callable[[List[str]], List[List[float]]] = None,
+        embed_fn: Callable[[List[str]], np.ndarray] = None,
         chunk_size: int = 500,
         overlap: int = 50,
+        batch_size: int = 64,
+        workers: int = 1,
+        batch_embed_fn: Callable[[List[str]], np.ndarray] = None,
         verbose: bool = False,
+        very_verbose: bool = False,
     ):
         """
         Initializes the DataImporter instance.
 
         Args:
             chroma_collection (PersistentClient): The Chroma collection to which the data will be added.
-            embed_fn (Callable[[List[str]], List[List[float]]]): A function that generates embeddings for the text chunks.
+            embed_fn (Callable[[List[str]], np.ndarray]): A function that generates embeddings for the text chunks.
             chunk_size (int): The maximum size of each text chunk in characters.
             overlap (int): The number of characters that overlap between adjacent chunks.
-            verbose (bool): Whether to enable verbose logging.
+            batch_size (int): The number of chunks embedded and added to the collection per call.
+            workers (int): The number of batches embedded concurrently. Useful for API-based embedders.
+            batch_embed_fn (Callable[[List[str]], np.ndarray]): Optional function embedding all new chunks in one
+                call (e.g. through the OpenAI Batch API), used instead of embed_fn. It decides itself whether
+                there are enough texts for an offline job.
+            verbose (bool): Whether to enable verbose logging. Added chunks are listed in one table at the end.
+            very_verbose (bool): Whether to also print a panel for every added chunk.
         """
         self.chroma_collection = chroma_collection
         self.embed_fn = embed_fn
         self.chunk_size = chunk_size
         self.overlap = overlap
+        self.batch_size = batch_size
+        self.workers = workers
+        self.batch_embed_fn = batch_embed_fn
         self.verbose = verbose
+        self.very_verbose = very_verbose
 
     def __show_table(self, items: List[dict]):
         """
@@ -58,6 +74,22 @@ class DataImporter:
 
         console.print(table)
 
+    def __show_added(self, rows: List[tuple]):
+        """
+        Helper method to list the added chunks in a single table.
+
+        Args:
+            rows (List[tuple]): (chunk id, chunk snippet) pairs.
+        """
+        table = Table(title="Added documents")
+        table.add_column("ID", style="cyan", no_wrap=True)
+        table.add_column("Chunk (snippet)", style="green")
+
+        for chunk_id, snippet in rows:
+            table.add_row(chunk_id, snippet)
+
+        console.print(table)
+
     def load_data(self, json_data: json):
         """
         Adds documents to the Chroma collection.
@@ -71,23 +103,71 @@ class DataImporter:
         if self.verbose:
             self.__show_table(items)
 
-        for item in items:
-            doc_id = item["id"]
-            doc_text = item["doc"]
-            meta = item.get("meta", {})
-
-            chunks = self.__chunk_text(doc_text)
-
-            for i, chunk in enumerate(chunks):
-                chunk_id = f"{doc_id}_chunk{i}"
-                if not self.chroma_collection.get(ids=[chunk_id]).get("ids"):
-                    self.chroma_collection.add(
-                        ids=[chunk_id],
-                        documents=[chunk],
-                        embeddings=self.embed_fn([chunk])[0] if self.embed_fn else None,
-                        metadatas=[meta],
+        # Work on parallel lists (ids, docs, metas) instead of a list of dicts
+        doc_ids = [item["id"] for item in items]
+        doc_metas = [item.get("meta", {}) for item in items]
+        chunks_per_doc = [self.__chunk_text(item["doc"]) for item in items]
+
+        chunk_ids: List[str] = []
+        chunk_docs: List[str] = []
+        chunk_metas: List[dict] = []
+        for doc_id, meta, chunks in zip(doc_ids, doc_metas, chunks_per_doc):
+            chunk_ids.extend(f"{doc_id}_chunk{i}" for i in range(len(chunks)))
+            chunk_docs.extend(chunks)
+            chunk_metas.extend([meta] * len(chunks))
+
+        # One lookup for the whole import instead of one per chunk; only ids are fetched
+        existing = (
+            set(
+                self.chroma_collection.get(ids=chunk_ids, include=[]).get("ids") or []
+            )
+            if chunk_ids
+            else set()
+        )
+        pending = []
+        for index, chunk_id in enumerate(chunk_ids):
+            if chunk_id in existing:
+                continue
+            # Also guards against the same id appearing twice in one import
+            existing.add(chunk_id)
+            pending.append(index)
+
+        if len(pending) < len(chunk_ids):
+            chunk_ids = [chunk_ids[i] for i in pending]
+            chunk_docs = [chunk_docs[i] for i in pending]
+            chunk_metas = [chunk_metas[i] for i in pending]
+
+        starts = range(0, len(chunk_ids), self.batch_size)
+        doc_batches = [chunk_docs[start : start + self.batch_size] for start in starts]
+
+        added_rows = []
+        # Embeddings are computed in worker threads; inserts stay in this thread
+        with ThreadPoolExecutor(max_workers=max(self.workers, 1)) as executor:
+            if self.batch_embed_fn:
+                all_embeddings = self.batch_embed_fn(chunk_docs)
+                embeddings = [
+                    all_embeddings[start : start + self.batch_size] for start in starts
+                ]
+            elif self.embed_fn:
+                embeddings = executor.map(self.embed_fn, doc_batches)
+            else:
+                embeddings = [None] * len(doc_batches)
+            for start, documents, batch_embeddings in zip(
+                starts, doc_batches, embeddings
+            ):
+                ids = chunk_ids[start : start + self.batch_size]
+                self.chroma_collection.add(
+                    ids=ids,
+                    documents=documents,
+                    embeddings=batch_embeddings,
+                    metadatas=chunk_metas[start : start + self.batch_size],
+                )
+                if self.verbose:
+                    added_rows.extend(
+                        (chunk_id, chunk[:80]) for chunk_id, chunk in zip(ids, documents)
                     )
-                    if self.verbose:
+                if self.very_verbose:
+                    for chunk_id, chunk in zip(ids, documents):
                         panel_text = (
                             "[bold cyan]Document:[/bold cyan]\n"
                             f"id: [green]{chunk_id}[/green]\n"
@@ -97,6 +177,7 @@ class DataImporter:
                         console.print(Panel(panel_text, title="Added documents"))
 
         if self.verbose:
+            self.__show_added(added_rows)
             console.print(
                 Panel("[green]Import completed successfully![/green]", title="Success")
             )
@@ -116,15 +197,14 @@ class DataImporter:
         if self.overlap < 0 or self.overlap >= self.chunk_size:
             raise ValueError("overlap must be >= 0 and smaller than chunk_size")
 
-        chunks: List[str] = []
-        step = self.chunk_size - self.overlap
-        start = 0
-        while start < len(text):
-            end = start + self.chunk_size
-            if end >= len(text):
-                chunk = text[-self.chunk_size :]
-                chunks.append(chunk)
-                break
-            chunks.append(text[start:end])
-            start += step
+        size = self.chunk_size
+        length = len(text)
+        if length <= size:
+            return [text] if text else []
+
+        starts = range(0, length - size + 1, size - self.overlap)
+        chunks = [text[start : start + size] for start in starts]
+        # The last chunk is aligned to the end of the text
+        if starts[-1] + size < length:
+            chunks.append(text[-size:])
         return chunks
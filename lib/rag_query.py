@@ -1,15 +1,37 @@
+import asyncio
+import atexit
+import json
 import os
-import requests
-from typing import Dict, Any
-from openai import OpenAI
+import httpx
+from typing import AsyncIterator, Dict, Any, Optional
+from openai import AsyncOpenAI, OpenAI
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
+from lib.retry import retry
+
+# Upper bound of concurrent outbound LLM requests made by the streaming API
+_REQUEST_LIMIT = asyncio.Semaphore(10)
+
+# Ollama errors worth retrying: failed or timed-out connects and dropped connections.
+# Read timeouts are not retried, as they would resubmit a slow generation from scratch
+_OLLAMA_TRANSIENT_ERRORS = (httpx.ConnectTimeout, httpx.NetworkError)
+
+# Shared Ollama clients, so connections are kept alive between queries
+OLLAMA_URL = "http://localhost:11434"
+_OLLAMA_HTTP = httpx.Client(base_url=OLLAMA_URL, timeout=60)
+_OLLAMA_ASYNC_HTTP = httpx.AsyncClient(base_url=OLLAMA_URL, timeout=60)
+atexit.register(_OLLAMA_HTTP.close)
+
 
 class LLMSearch:
     """Universal class for handling RAG queries with OpenAI or Ollama."""
 
+    # Fixed parts of the prompt built by _build_prompt
+    _PROMPT_PREFIX = "Answer the user's question based on the context.\n\nContext:\n"
+    _PROMPT_QUESTION = "\n\nQuestion:\n"
+
     def __init__(self, provider: str, model: str, verbose: bool = False):
         """
         Initializes the LLMSearch instance with the selected provider and model.
@@ -29,8 +51,10 @@ class LLMSearch:
             if not api_key:
                 raise EnvironmentError("Missing environment variable OPENAI_API_KEY")
             self.client = OpenAI(api_key=api_key)
+            self.async_client = AsyncOpenAI(api_key=api_key)
         elif self.provider == "local":
             self.client = None
+            self.async_client = None
         else:
             raise ValueError(f"Unsupported provider: {provider}")
 
@@ -50,50 +74,130 @@ class LLMSearch:
             return self._ask_ollama(prompt)
         return None
 
-    def search_with_context(self, user_query: str, results: Dict[str, Any]) -> str:
+    async def astream(self, prompt: str) -> AsyncIterator[str]:
         """
-        Builds a prompt based on RAG results and sends it to the LLM.
+        Sends a query to the selected model and yields the response as it is generated.
+
+        The number of concurrent requests is limited by a shared semaphore. Opening the stream is retried
+        on transient errors: by the OpenAI client itself, or by _aopen_ollama_stream for Ollama.
+
+        Args:
+            prompt (str): The prompt to send to the model.
+
+        Yields:
+            str: Consecutive fragments of the response.
+        """
+        messages = [
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": prompt},
+        ]
+
+        async with _REQUEST_LIMIT:
+            if self.provider == "openai":
+                response = await self.async_client.chat.completions.create(
+                    model=self.model, messages=messages, stream=True
+                )
+                async for chunk in response:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            elif self.provider == "local":
+                payload = {"model": self.model, "messages": messages, "stream": True}
+                response = await self._aopen_ollama_stream(payload)
+                try:
+                    async for line in response.aiter_lines():
+                        if not line:
+                            continue
+                        data = json.loads(line)
+                        if data.get("message", {}).get("content"):
+                            yield data["message"]["content"]
+                        if data.get("done"):
+                            break
+                finally:
+                    await response.aclose()
+
+    def _build_prompt(self, user_query: str, results: Dict[str, Any]) -> Optional[str]:
+        """
+        Builds the prompt sent to the LLM from the RAG results.
 
         Args:
             user_query (str): The user query to ask the model.
             results (Dict[str, Any]): The RAG results containing documents to be used as context.
 
         Returns:
-            str: The response from the model.
+            Optional[str]: The prompt, or None if there are no documents to use as context.
         """
         if self.verbose:
             self._print_results_table(results)
 
         retrieved_docs = results.get("documents", [[]])
         if not retrieved_docs or not retrieved_docs[0]:
-            return "[No results to process.]"
+            return None
+
+        prompt = "".join(
+            (
+                self._PROMPT_PREFIX,
+                "\n".join(retrieved_docs[0]),
+                self._PROMPT_QUESTION,
+                user_query,
+            )
+        )
 
-        context = "\n".join(retrieved_docs[0])
-        prompt = f"""
-        Answer the user's question based on the context.
+        if self.verbose:
+            self.console.print(Panel(prompt, title="Sent Prompt"))
 
-        Context:
-        {context}
+        return prompt
 
-        Question:
-        {user_query}
+    def search_with_context(self, user_query: str, results: Dict[str, Any]) -> str:
         """
+        Builds a prompt based on RAG results and sends it to the LLM.
 
-        if self.verbose:
-            self.console.print(Panel(prompt.strip(), title="Sent Prompt"))
+        Args:
+            user_query (str): The user query to ask the model.
+            results (Dict[str, Any]): The RAG results containing documents to be used as context.
+
+        Returns:
+            str: The response from the model.
+        """
+        prompt = self._build_prompt(user_query, results)
+        if prompt is None:
+            return "[No results to process.]"
 
         try:
-            return self.ask(prompt.strip())
+            return self.ask(prompt)
         except Exception as e:
             return f"[LLM query error]: {e}"
 
+    async def astream_with_context(
+        self, user_query: str, results: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """
+        Builds a prompt based on RAG results and yields the LLM response as it is generated.
+
+        Unlike search_with_context, errors are raised rather than returned as text, since part of
+        the answer may already have been yielded when the stream fails.
+
+        Args:
+            user_query (str): The user query to ask the model.
+            results (Dict[str, Any]): The RAG results containing documents to be used as context.
+
+        Yields:
+            str: Consecutive fragments of the response.
+        """
+        prompt = self._build_prompt(user_query, results)
+        if prompt is None:
+            yield "[No results to process.]"
+            return
+
+        async for fragment in self.astream(prompt):
+            yield fragment
+
     # -------------------------------
     # PROVIDERS
     # -------------------------------
 
     def _ask_openai(self, prompt: str) -> str:
         """
-        Sends the prompt to the OpenAI API.
+        Sends the prompt to the OpenAI API. Transient errors are retried by the OpenAI client.
 
         Args:
             prompt (str): The prompt to send to the OpenAI model.
@@ -120,7 +224,6 @@ class LLMSearch:
         Returns:
             str: The response from Ollama.
         """
-        url = "http://localhost:11434/api/chat"
         payload = {
             "model": self.model,
             "messages": [
@@ -131,18 +234,52 @@ class LLMSearch:
         }
 
         try:
-            response = requests.post(url, json=payload, timeout=60)
-            response.raise_for_status()
-            data = response.json()
+            data = self._post_ollama(payload)
             if "message" in data:
                 return data["message"]["content"]
             elif "messages" in data:
                 return data["messages"][-1]["content"]
             else:
                 return "[Error]: Unexpected response format from Ollama."
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             return f"[Connection error with Ollama]: {e}"
 
+    @staticmethod
+    @retry(_OLLAMA_TRANSIENT_ERRORS)
+    def _post_ollama(payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Posts a chat request to Ollama over the shared keep-alive client,
+        retrying on connection errors.
+
+        Args:
+            payload (Dict[str, Any]): The request body.
+
+        Returns:
+            Dict[str, Any]: The decoded JSON response.
+        """
+        response = _OLLAMA_HTTP.post("/api/chat", json=payload)
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    @retry(_OLLAMA_TRANSIENT_ERRORS)
+    async def _aopen_ollama_stream(payload: Dict[str, Any]) -> httpx.Response:
+        """
+        Opens a streaming chat request to Ollama, retrying on connection errors.
+
+        Args:
+            payload (Dict[str, Any]): The request body.
+
+        Returns:
+            httpx.Response: The response with an unread body; the caller must close it.
+        """
+        request = _OLLAMA_ASYNC_HTTP.build_request("POST", "/api/chat", json=payload)
+        response = await _OLLAMA_ASYNC_HTTP.send(request, stream=True)
+        if response.is_error:
+            await response.aclose()
+            response.raise_for_status()
+        return response
+
     def _print_results_table(self, results: Dict[str, Any]):
         """
         Prints the results of the RAG search in a formatted table.
@@ -0,0 +1,64 @@
+import asyncio
+import functools
+import random
+import time
+from typing import Callable, Optional, Tuple, Type
+
+
+def retry(
+    exceptions: Tuple[Type[BaseException], ...],
+    max_attempts: int = 3,
+    base: float = 1.0,
+    jitter: bool = True,
+    when: Optional[Callable[[BaseException], bool]] = None,
+) -> Callable:
+    """
+    Decorator retrying a function with exponential backoff on transient errors.
+
+    Works with both regular and async functions. The delay before attempt i+1 is
+    base * 2**i seconds, plus a random value in [0, base) when jitter is enabled.
+    Callers list the transient errors of their own clients, so this module has no
+    dependency on any of them.
+
+    Args:
+        exceptions (Tuple[Type[BaseException], ...]): Exception types that trigger a retry.
+        max_attempts (int): Total number of attempts, including the first one.
+        base (float): Base delay in seconds.
+        jitter (bool): Whether to add random jitter to the delay.
+        when (Optional[Callable[[BaseException], bool]]): Further filters the caught exceptions; those for which it returns False are raised at once.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def delay(attempt: int) -> float:
+        return base * 2**attempt + (random.uniform(0, base) if jitter else 0)
+
+    def decorator(fn: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                for attempt in range(max_attempts):
+                    try:
+                        return await fn(*args, **kwargs)
+                    except exceptions as e:
+                        if attempt == max_attempts - 1 or (when and not when(e)):
+                            raise
+                        await asyncio.sleep(delay(attempt))
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_attempts):
+                try:
+                    return fn(*args, **kwargs)
+                except exceptions as e:
+                    if attempt == max_attempts - 1 or (when and not when(e)):
+                        raise
+                    time.sleep(delay(attempt))
+
+        return wrapper
+
+    return decorator
@@ -1,7 +1,90 @@
-import json
-import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+import asyncio
+import codecs
+import contextlib
+import logging
+import multiprocessing
+import os
+import queue
+import re
+import threading
+import httpx
+from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from selectolax.lexbor import LexborHTMLParser
+from typing import AsyncIterator, Iterator, List, Dict, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+from lib.page_cache import PageCache
+from lib.retry import retry
+
+log = logging.getLogger(__name__)
+
+# Maximum number of pages downloaded at the same time
+_MAX_CONCURRENT_FETCHES = 20
+# Maximum number of pages downloaded from one host at the same time
+_MAX_CONCURRENT_FETCHES_PER_HOST = 6
+
+# Predefined documents returned when no URLs are given
+_SAMPLE_DOCS = [
+    {"id": "doc1", "doc": "Chroma is an engine for vector databases.", "meta": {"source": "notes"}},
+    {"id": "doc2", "doc": "OpenAI embeddings allow text to be converted into vectors.", "meta": {"source": "blog"}},
+    {"id": "doc3", "doc": "LangChain makes it easier to create applications based on LLMs.", "meta": {"source": "documentation"}},
+    {"id": "doc4", "doc": "Vector databases enable efficient searching through large text data sets.", "meta": {"source": "article"}},
+    {"id": "doc5", "doc": "RAG combines text generation with real-time information retrieval.", "meta": {"source": "presentation"}},
+]
+
+# Document ids are built from the URL without its scheme and with "/" replaced by "_"
+_SCHEME_RE = re.compile(r"^https?://")
+_SLASH_TABLE = str.maketrans({"/": "_"})
+
+# Runs of whitespace collapsed to a single space in extracted text
+_WS_RE = re.compile(r"\s+")
+
+# Charset declared in a Content-Type header or in the <meta> tags at the start of a page
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+
+# Pages larger than this are skipped (known size) or truncated (unknown size)
+_MAX_BYTES = 5 * 1024 * 1024
+
+# Connection pool shared by all fetches of a load; connections are kept alive per host
+# and HTTP/2 multiplexes concurrent requests to the same host over one connection
+_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+# Connection-specific headers such as "Connection: keep-alive" are not allowed in HTTP/2;
+# HTTP/1.1 connections are persistent by default
+_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; RAG-DataLoader/0.1)"}
+
+# Errors of a page request that may be retried; status errors are further filtered by _is_transient
+_TRANSIENT_ERRORS = (httpx.TimeoutException, httpx.NetworkError, httpx.HTTPStatusError)
+# Response statuses worth retrying: rate limiting and temporary server errors
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Parser workers are started from the thread running the fetch event loop; forking a
+# multi-threaded process can deadlock, so they are started by a forkserver or spawned
+_PARSER_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Maximum number of fetched documents waiting for a streaming consumer
+_MAX_PENDING_DOCS = 4
+# Marks the end of a document stream
+_DONE = object()
+
+
+def _is_transient(error: BaseException) -> bool:
+    """
+    Tells whether a failed page request is worth retrying.
+
+    Args:
+        error (BaseException): The error raised by the request.
+
+    Returns:
+        bool: False for HTTP status errors other than rate limiting and temporary server errors, True otherwise.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in _RETRY_STATUSES
+    return True
 
 
 class DataLoader:
@@ -14,9 +97,14 @@ class DataLoader:
 
     Methods:
         - load_docs: Loads documents by either fetching content from provided URLs or returning sample data.
-        - _fetch_url_text: Fetches and extracts plain text content from a given URL.
-        - _load_data_from_url: Fetches content from a list of URLs and returns it in a structured format.
-        - _load_sample_data: Returns predefined sample data in JSON format.
+        - iload_docs: Like load_docs, but yields the documents one by one as soon as each page is fetched.
+        - _fetch_url_text: Asynchronously fetches and extracts plain text content from a given URL.
+        - _download: Asynchronously downloads the body of a page.
+        - _decode_html: Decodes an HTML document with its declared charset if it is not UTF-8.
+        - _parse_html: Parses an HTML document once and extracts its content.
+        - _extract: Extracts the content of a parsed page.
+        - _load_data_from_url: Fetches content from a list of URLs concurrently and returns it in a structured format.
+        - _load_sample_data: Returns predefined sample data.
 
     Example usage:
         data_loader = DataLoader()
@@ -28,38 +116,406 @@ class DataLoader:
         pass
 
     @staticmethod
-    def _fetch_url_text(url: str) -> str:
+    def _decode_html(html: bytes, content_type: str = "") -> Union[bytes, str]:
+        """
+        Prepares an HTML document for the parser, decoding it only if it is not UTF-8.
+
+        selectolax's lexbor parser always decodes bytes as UTF-8. The charset is taken from the Content-Type
+        header or, failing that, from a <meta> tag in the first 2 KB of the page, without any statistical
+        detection. UTF-8 and undeclared pages are returned as bytes and decoded by the parser itself.
+
+        Args:
+            html (bytes): The HTML document.
+            content_type (str): The Content-Type header of the response.
+
+        Returns:
+            Union[bytes, str]: The document as bytes if the parser can decode it, otherwise as a string.
+        """
+        match = _CHARSET_RE.search(content_type) or _META_CHARSET_RE.search(html[:2048])
+        if not match:
+            return html
+        charset = match.group(1)
+        if isinstance(charset, bytes):
+            charset = charset.decode("ascii")
+        try:
+            encoding = codecs.lookup(charset).name
+        except LookupError:
+            return html
+        if encoding == "utf-8":
+            return html
+        return html.decode(encoding, errors="replace")
+
+    @staticmethod
+    def _parse_html(html: bytes, content_type: str = "") -> Dict:
+        """
+        Parses an HTML document once and extracts its content, skipping scripts, styles and embedded frames.
+
+        The document is handed to selectolax's lexbor C parser, see _decode_html for how it is decoded.
+
+        Args:
+            html (bytes): The HTML document.
+            content_type (str): The Content-Type header of the response.
+
+        Returns:
+            Dict: The extracted content, see _extract.
+        """
+        return DataLoader._extract(LexborHTMLParser(DataLoader._decode_html(html, content_type)))
+
+    @staticmethod
+    def _extract(tree: LexborHTMLParser) -> Dict:
+        """
+        Extracts the content of a parsed page.
+
+        All fields are read from the same tree, so adding an extractor never parses the page again.
+
+        Args:
+            tree (LexborHTMLParser): The parsed HTML document. Scripts, styles and embedded frames are removed from it.
+
+        Returns:
+            Dict: A dictionary with the following keys:
+                - "text": The plain text content with whitespace collapsed.
+        """
+        tree.strip_tags(["script", "style", "noscript", "iframe"])
+        root = tree.body or tree.root
+        # One C-level text extraction plus one regex pass; walking the text nodes from
+        # Python to join stripped parts is slower and still needs the collapse
+        text = root.text(separator=" ") if root else ""
+        text = _WS_RE.sub(" ", text).strip()
+        return {"text": text}
+
+    @staticmethod
+    @retry(_TRANSIENT_ERRORS, base=0.3, when=_is_transient)
+    async def _stream_body(
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[Tuple[Optional[bytes], httpx.Headers]]:
+        """
+        Streams the body of a page, retrying rate limits, server errors, timeouts and dropped connections.
+
+        Responses that are not HTML or text, or that declare a size above 5 MB, are dropped without
+        downloading them, and bodies of unknown size are cut at 5 MB. The download slot is released
+        while waiting before a retry.
+
+        Args:
+            client (httpx.AsyncClient): The HTTP client shared by all fetches.
+            semaphore (asyncio.Semaphore): Limits the number of concurrent downloads.
+            url (str): The URL of the page to fetch.
+            headers (Optional[Dict[str, str]]): Extra request headers, e.g. for a conditional GET.
+
+        Returns:
+            Optional[Tuple[Optional[bytes], httpx.Headers]]: The body and the response headers, or None if the page was skipped.
+                The body is None if the server answered 304 Not Modified.
+        """
+        async with semaphore:
+            async with client.stream("GET", url, headers=headers) as r:
+                if r.status_code == 304:
+                    return None, r.headers
+                r.raise_for_status()
+
+                # Skip non-HTML and oversized responses before downloading the body
+                content_type = r.headers.get("Content-Type", "")
+                if content_type and not content_type.startswith(
+                    ("text/", "application/xhtml")
+                ):
+                    return None
+                content_length = r.headers.get("Content-Length", "")
+                if content_length.isdigit() and int(content_length) > _MAX_BYTES:
+                    return None
+
+                body = bytearray()
+                async for chunk in r.aiter_bytes(chunk_size=65536):
+                    body.extend(chunk)
+                    if len(body) >= _MAX_BYTES:
+                        del body[_MAX_BYTES:]
+                        break
+        return bytes(body), r.headers
+
+    @staticmethod
+    async def _download(
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[Tuple[Optional[bytes], httpx.Headers]]:
+        """
+        Downloads the body of a page, logging and skipping pages that cannot be retrieved.
+
+        Only HTTP and URL errors are handled here; anything else is a bug and is raised.
+
+        Args:
+            client (httpx.AsyncClient): The HTTP client shared by all fetches.
+            semaphore (asyncio.Semaphore): Limits the number of concurrent downloads.
+            url (str): The URL of the page to fetch.
+            headers (Optional[Dict[str, str]]): Extra request headers, e.g. for a conditional GET.
+
+        Returns:
+            Optional[Tuple[Optional[bytes], httpx.Headers]]: The body and the response headers, or None if the page was skipped or could not be retrieved.
+                The body is None if the server answered 304 Not Modified.
+        """
+        try:
+            return await DataLoader._stream_body(client, semaphore, url, headers)
+        except (httpx.HTTPError, httpx.InvalidURL) as e:
+            log.warning("Failed to fetch %s: %s", url, e)
+            return None
+
+    @staticmethod
+    async def _fetch_url_text(
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        cache: Optional[PageCache],
+        parser_pool: Optional[Executor],
+        url: str,
+    ) -> str:
         """
         Fetches the page content from the provided URL and extracts plain text.
 
+        Downloading and extraction are done by _download and _parse_html. Parsing runs in the parser pool,
+        so the event loop keeps downloading other pages. Pages with a fresh entry in the cache are neither
+        downloaded nor parsed; stale entries are revalidated with If-None-Match / If-Modified-Since
+        and reused without parsing if the page has not changed.
+
         Args:
+            client (httpx.AsyncClient): The HTTP client shared by all fetches.
+            semaphore (asyncio.Semaphore): Limits the number of concurrent downloads.
+            cache (Optional[PageCache]): Cache of extracted page texts, or None to always fetch.
+            parser_pool (Optional[Executor]): Executor running the HTML parser; None uses the default thread pool.
             url (str): The URL of the page to fetch.
 
         Returns:
             str: The plain text content of the page, or an empty string if the content could not be retrieved.
         """
-        try:
-            r = requests.get(url, timeout=10)
-            r.raise_for_status()
-        except Exception as e:
-            print(f"Nie udało się pobrać {url}: {e}")
+        cached = cache.get(url) if cache else None
+        if cached and cached["fresh"]:
+            return cached["text"]
+
+        conditional = {}
+        if cached:
+            if cached["etag"]:
+                conditional["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                conditional["If-Modified-Since"] = cached["last_modified"]
+
+        downloaded = await DataLoader._download(client, semaphore, url, conditional)
+        if downloaded is None:
             return ""
+        body, headers = downloaded
+        if body is None:
+            if not cached:
+                return ""
+            cache.refresh(url, headers)
+            return cached["text"]
 
-        soup = BeautifulSoup(r.text, "html.parser")
-        for s in soup(["script", "style", "noscript", "iframe"]):
-            s.extract()
-        text = soup.get_text(separator=" ")
-        text = " ".join(text.split())
+        loop = asyncio.get_running_loop()
+        content_type = headers.get("Content-Type", "")
+        try:
+            page = await loop.run_in_executor(
+                parser_pool, DataLoader._parse_html, body, content_type
+            )
+        except BrokenProcessPool:
+            # Worker processes cannot start, e.g. when the calling script lacks an
+            # `if __name__ == "__main__":` guard; parse in this process instead
+            log.debug("Parser processes unavailable, parsing %s in a thread", url)
+            page = await loop.run_in_executor(
+                None, DataLoader._parse_html, body, content_type
+            )
+        text = page["text"]
+        if cache and text:
+            cache.set(url, text, headers)
         return text
 
     @staticmethod
-    def _load_data_from_url(urls: List[str]) -> List[Dict]:
+    def _create_client() -> httpx.AsyncClient:
+        """
+        Creates the pooled HTTP client used to fetch pages.
+
+        HTTP/2 is negotiated where the server supports it. Failed requests are retried by _stream_body, not by the transport.
+
+        Returns:
+            httpx.AsyncClient: The HTTP client.
+        """
+        return httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(http2=True, limits=_LIMITS),
+            headers=_HEADERS,
+            timeout=10,
+            follow_redirects=True,
+        )
+
+    @staticmethod
+    async def _fetch_indexed(
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        host_semaphore: asyncio.Semaphore,
+        cache: Optional[PageCache],
+        parser_pool: Optional[Executor],
+        idx: int,
+        url: str,
+    ) -> Tuple[int, str]:
+        """
+        Fetches one URL, a few at a time per host, and tags the result with the URL's index.
+
+        Args:
+            client (httpx.AsyncClient): The HTTP client shared by all fetches.
+            semaphore (asyncio.Semaphore): Limits the number of concurrent downloads across all hosts.
+            host_semaphore (asyncio.Semaphore): Limits the number of concurrent downloads from the URL's host.
+            cache (Optional[PageCache]): Cache of extracted page texts, or None to always fetch.
+            parser_pool (Optional[Executor]): Executor running the HTML parser.
+            idx (int): Position of the URL in the input list.
+            url (str): The URL of the page to fetch.
+
+        Returns:
+            Tuple[int, str]: The index and the page text.
+        """
+        async with host_semaphore:
+            text = await DataLoader._fetch_url_text(
+                client, semaphore, cache, parser_pool, url
+            )
+        return idx, text
+
+    @staticmethod
+    async def _iter_fetched(
+        urls: List[str], cache: Optional[PageCache] = None
+    ) -> AsyncIterator[Tuple[int, str]]:
         """
-        Fetches the content of pages from the provided list of URLs and returns a list of dictionaries in the following format:
+        Fetches all URLs concurrently, grouped by host, and yields each page as soon as it is parsed.
+
+        Args:
+            urls (List[str]): A list of URLs to fetch content from.
+            cache (Optional[PageCache]): Cache of extracted page texts, or None to always fetch.
+
+        Yields:
+            Tuple[int, str]: (index, page text) pairs in completion order.
+        """
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_FETCHES)
+        # Parsing is CPU bound, so several pages are parsed in separate processes;
+        # for a single page the process start-up would cost more than it saves
+        parser_pool = (
+            ProcessPoolExecutor(
+                max_workers=min(len(urls), os.cpu_count() or 1),
+                mp_context=_PARSER_MP_CONTEXT,
+            )
+            if len(urls) > 1
+            else None
+        )
+        # Group URLs by host so each host's requests reuse its warm connection
+        groups: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+        for idx, url in enumerate(urls):
+            groups[urlparse(url).netloc].append((idx, url))
+        host_semaphores = {
+            host: asyncio.Semaphore(_MAX_CONCURRENT_FETCHES_PER_HOST) for host in groups
+        }
+
+        try:
+            async with DataLoader._create_client() as client:
+                tasks = [
+                    asyncio.ensure_future(
+                        DataLoader._fetch_indexed(
+                            client, semaphore, host_semaphores[host], cache, parser_pool, idx, url
+                        )
+                    )
+                    for host, entries in groups.items()
+                    for idx, url in entries
+                ]
+                try:
+                    for next_done in asyncio.as_completed(tasks):
+                        yield await next_done
+                finally:
+                    # The consumer may stop early; do not leave downloads running
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            if parser_pool:
+                parser_pool.shutdown()
+
+    @staticmethod
+    def _make_doc(idx: int, url: str, text: str) -> Dict:
+        """
+        Builds the document dictionary of a fetched page.
+
+        Args:
+            idx (int): Position of the URL in the input list.
+            url (str): The URL of the page.
+            text (str): The plain text content of the page.
+
+        Returns:
+            Dict: The document with "id", "doc" and "meta" keys.
+        """
+        return {
+            "id": f"doc-{idx}-{_SCHEME_RE.sub('', url).translate(_SLASH_TABLE)}",
+            "doc": text,
+            "meta": {"source": url},
+        }
+
+    @staticmethod
+    def _iter_indexed_docs(urls: List[str], use_cache: bool = True) -> Iterator[Tuple[int, Dict]]:
+        """
+        Yields fetched documents together with the index of their URL, as soon as each page is ready.
+
+        The pages are fetched by an event loop in a background thread, so this also works when called
+        from code that already runs an event loop. At most a few finished documents wait for the consumer;
+        further downloads are held back until it catches up.
+
+        Args:
+            urls (List[str]): A list of URLs to fetch content from.
+            use_cache (bool): Whether to reuse page texts cached on disk by previous runs.
+
+        Yields:
+            Tuple[int, Dict]: (index, document) pairs in completion order. Pages without content are skipped.
+        """
+        cache = PageCache() if use_cache else None
+        results: queue.Queue = queue.Queue(maxsize=_MAX_PENDING_DOCS)
+        stop = threading.Event()
+
+        def put(item) -> bool:
+            # Gives up when the consumer is gone, so the producer thread never blocks forever
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        async def produce():
+            async with contextlib.aclosing(DataLoader._iter_fetched(urls, cache)) as pages:
+                async for idx, text in pages:
+                    if not text:
+                        continue
+                    doc = DataLoader._make_doc(idx, urls[idx], text)
+                    if not await asyncio.to_thread(put, (idx, doc)):
+                        return
+
+        def run():
+            try:
+                asyncio.run(produce())
+            except BaseException as e:
+                put(e)
+                return
+            put(_DONE)
+
+        threading.Thread(target=run, daemon=True).start()
+        try:
+            while True:
+                item = results.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+
+    @staticmethod
+    def _load_data_from_url(urls: List[str], use_cache: bool = True) -> List[Dict]:
+        """
+        Fetches the content of pages from the provided list of URLs concurrently and returns a list of dictionaries in the following format:
         [{"id": ..., "doc": ..., "meta": {"source": ...}}, ...]
 
         Args:
             urls (List[str]): A list of URLs to fetch content from.
+            use_cache (bool): Whether to reuse page texts cached on disk by previous runs.
 
         Returns:
             List[Dict]: A list of dictionaries where each dictionary contains the following keys:
@@ -74,23 +530,16 @@ class DataLoader:
             ]
         """
 
-        data = []
-        for idx, url in enumerate(urls):
-            page_body = DataLoader._fetch_url_text(url)
-            if page_body:
-                data.append(
-                    {
-                        "id": f"doc-{idx}-{url.replace('https://', '').replace('/', '_')}",
-                        "doc": page_body,
-                        "meta": {"source": url},
-                    }
-                )
-        return data
+        # Documents arrive in completion order; slotting them by index restores the URL order
+        data: List[Optional[Dict]] = [None] * len(urls)
+        for idx, doc in DataLoader._iter_indexed_docs(urls, use_cache):
+            data[idx] = doc
+        return [doc for doc in data if doc]
 
     @staticmethod
     def _load_sample_data() -> List[Dict]:
         """
-        Returns sample data in JSON format.
+        Returns the sample data.
 
         This method provides a predefined set of sample documents, each containing an identifier (`id`),
         text content (`doc`), and metadata (`meta`) with the source of the document.
@@ -107,27 +556,24 @@ class DataLoader:
                 {"id": "doc2", "doc": "OpenAI embeddings allow text to be converted into vectors.", "meta": {"source": "blog"}}
             ]
         """
-        json_data = """
-        [
-            {"id":"doc1", "doc":"Chroma is an engine for vector databases.", "meta":{"source":"notes"}},
-            {"id":"doc2", "doc":"OpenAI embeddings allow text to be converted into vectors.", "meta":{"source":"blog"}},
-            {"id":"doc3", "doc":"LangChain makes it easier to create applications based on LLMs.", "meta":{"source":"documentation"}},
-            {"id":"doc4", "doc":"Vector databases enable efficient searching through large text data sets.", "meta":{"source":"article"}},
-            {"id":"doc5", "doc":"RAG combines text generation with real-time information retrieval.", "meta":{"source":"presentation"}}
-        ]
-        """
-        return json.loads(json_data)
+        # Copies, so callers can modify the documents without changing the shared sample data
+        return [dict(doc, meta=dict(doc["meta"])) for doc in _SAMPLE_DOCS]
 
     @staticmethod
-    def load_docs(urls: Optional[List[str]] = None) -> List[Dict]:
+    def load_docs(urls: Optional[List[str]] = None, use_cache: bool = True) -> List[Dict]:
         """
         Loads documents. If URLs are provided, fetches their content; otherwise, returns sample data.
 
         If a list of URLs is provided, this method will attempt to fetch the content from each URL and return it in the
         form of a list of dictionaries. If no URLs are provided, it will return a predefined set of sample data.
 
+        Pages are parsed in worker processes, which import the calling script again; call this method from
+        under an `if __name__ == "__main__":` guard. Without it the pages are still loaded, parsed in threads,
+        but every worker re-runs the script before failing to start.
+
         Args:
             urls (Optional[List[str]], optional): A list of URLs to fetch content from. Defaults to None.
+            use_cache (bool): Whether to reuse page texts cached on disk by previous runs. Defaults to True.
 
         Returns:
             List[Dict]: A list of dictionaries, where each dictionary contains the following:
@@ -149,5 +595,27 @@ class DataLoader:
             ]
         """
         if urls:
-            return DataLoader._load_data_from_url(urls)
+            return DataLoader._load_data_from_url(urls, use_cache)
         return DataLoader._load_sample_data()
+
+    @staticmethod
+    def iload_docs(urls: Optional[List[str]] = None, use_cache: bool = True) -> Iterator[Dict]:
+        """
+        Loads documents one by one. If URLs are provided, yields each page as soon as it is fetched; otherwise, yields sample data.
+
+        Unlike load_docs, the fetched pages are not collected into a list first, so a consumer that chunks and
+        embeds documents incrementally keeps only a few of them in memory. Documents come in completion order,
+        not in the order of the URLs. As with load_docs, call it from under an `if __name__ == "__main__":` guard.
+
+        Args:
+            urls (Optional[List[str]], optional): A list of URLs to fetch content from. Defaults to None.
+            use_cache (bool): Whether to reuse page texts cached on disk by previous runs. Defaults to True.
+
+        Yields:
+            Dict: A document with the "id", "doc" and "meta" keys, as returned by load_docs.
+        """
+        if not urls:
+            yield from DataLoader._load_sample_data()
+            return
+        for _, doc in DataLoader._iter_indexed_docs(urls, use_cache):
+            yield doc
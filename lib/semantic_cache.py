@@ -0,0 +1,172 @@
+import glob
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class SemanticCache:
+    """
+    Cache of query answers looked up by embedding similarity instead of exact text.
+
+    Query embeddings are kept L2-normalized in a float32 matrix, so a lookup is a single matrix-vector
+    product. When the best cosine similarity reaches the threshold, the stored payload is returned.
+    Saved caches are reloaded when their files are changed or removed by another process.
+    """
+
+    def __init__(
+        self, path: Optional[str] = None, threshold: float = 0.97, max_entries: int = 1000
+    ):
+        """
+        Initializes the SemanticCache, loading previously saved entries from disk if present.
+
+        Args:
+            path (Optional[str]): Path prefix for the saved cache files (.npy and .json). None keeps the cache in memory only.
+            threshold (float): Minimum cosine similarity for a cached entry to be returned.
+            max_entries (int): Maximum number of entries; the oldest ones are dropped first.
+        """
+        self.path = path
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._embeddings: Optional[np.ndarray] = None
+        self._payloads: List[Any] = []
+        self._version: Optional[Tuple[int, int]] = None
+        self._load()
+
+    @staticmethod
+    def remove_files(prefix: str):
+        """
+        Removes the saved files of every cache whose path starts with the prefix.
+
+        Args:
+            prefix (str): Common path prefix of the caches, e.g. the database location.
+        """
+        for suffix in (".npy", ".json"):
+            for file in glob.glob(f"{glob.escape(prefix)}*{suffix}"):
+                os.remove(file)
+
+    def _file_version(self) -> Optional[Tuple[int, int]]:
+        """
+        Identifies the current state of the saved cache files.
+
+        Returns:
+            Optional[Tuple[int, int]]: Modification time and size of the .json file, or None if it does not exist.
+        """
+        try:
+            stat = os.stat(f"{self.path}.json")
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load(self):
+        """
+        Replaces the in-memory entries with the saved ones, if a path is set.
+        """
+        if not self.path:
+            return
+        self._embeddings = None
+        self._payloads = []
+        self._version = self._file_version()
+        if self._version is None or not os.path.exists(f"{self.path}.npy"):
+            return
+
+        embeddings = np.load(f"{self.path}.npy")
+        with open(f"{self.path}.json", encoding="utf-8") as f:
+            payloads = json.load(f)
+        # The files are written one after the other; ignore a half-written pair
+        if len(payloads) == embeddings.shape[0]:
+            self._embeddings = embeddings
+            self._payloads = payloads
+
+    def _sync(self):
+        """
+        Reloads the entries if the saved files changed since they were last read or written.
+        """
+        if self.path and self._file_version() != self._version:
+            self._load()
+
+    @staticmethod
+    def _normalize(embedding: np.ndarray) -> np.ndarray:
+        """
+        Converts an embedding to a unit-length float32 vector.
+
+        Args:
+            embedding (np.ndarray): The embedding to normalize.
+
+        Returns:
+            np.ndarray: The normalized vector.
+        """
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, embedding: np.ndarray, match: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """
+        Returns the payload of the most similar cached query, if it is similar enough.
+
+        Args:
+            embedding (np.ndarray): The embedding of the incoming query.
+            match (Optional[Dict[str, Any]]): Key-value pairs a payload must contain to be returned, e.g. query parameters.
+
+        Returns:
+            Optional[Any]: The cached payload, or None on a miss.
+        """
+        self._sync()
+        if self._embeddings is None or not len(self._payloads):
+            return None
+
+        query = self._normalize(embedding)
+        if query.shape[0] != self._embeddings.shape[1]:
+            return None
+
+        similarities = self._embeddings @ query
+        if match:
+            for index, payload in enumerate(self._payloads):
+                if any(payload.get(key) != value for key, value in match.items()):
+                    similarities[index] = -np.inf
+        best = int(similarities.argmax())
+        if similarities[best] >= self.threshold:
+            return self._payloads[best]
+        return None
+
+    def add(self, embedding: np.ndarray, payload: Any):
+        """
+        Stores a payload for the given query embedding and saves the cache if a path is set.
+
+        Args:
+            embedding (np.ndarray): The embedding of the query.
+            payload (Any): JSON-serializable data to return on later hits.
+        """
+        self._sync()
+        vector = self._normalize(embedding)[np.newaxis, :]
+        if self._embeddings is None or self._embeddings.shape[1] != vector.shape[1]:
+            self._embeddings = vector
+            self._payloads = [payload]
+        else:
+            self._embeddings = np.vstack([self._embeddings, vector])[-self.max_entries :]
+            self._payloads = (self._payloads + [payload])[-self.max_entries :]
+        self.save()
+
+    def clear(self):
+        """
+        Removes all entries, e.g. after new documents were imported.
+        """
+        self._embeddings = None
+        self._payloads = []
+        self._version = None
+        if self.path:
+            for suffix in (".npy", ".json"):
+                if os.path.exists(f"{self.path}{suffix}"):
+                    os.remove(f"{self.path}{suffix}")
+
+    def save(self):
+        """
+        Writes the cache to disk if a path is set.
+        """
+        if not self.path or self._embeddings is None:
+            return
+        np.save(f"{self.path}.npy", self._embeddings)
+        with open(f"{self.path}.json", "w", encoding="utf-8") as f:
+            json.dump(self._payloads, f, ensure_ascii=False)
+        self._version = self._file_version()